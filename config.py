@@ -7,6 +7,8 @@ Keep runtime-safe (no secrets).
 # UI
 MAX_INDIVIDUAL_DOWNLOADS = 10  # <= this: individual PDF downloads + previews; > this: ZIP download
 ZIP_SPOOL_MAX_BYTES = 25 * 1024 * 1024  # spill ZIP to disk after ~25MB
+MULTISELECT_MAX_OPTIONS = 500  # visible rows offered in the "Selected members" picker (plus the selection)
+RENDER_WORKERS = 1  # render processes for ZIP batches in the app (1 = in-process; hosts are shared and memory-limited)
 
 PREVIEW_COLUMNS_DESKTOP = 5
 PREVIEW_COLUMNS_MOBILE = 2
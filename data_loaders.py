@@ -5,37 +5,295 @@ Important: Keep imports light at module import time (Streamlit Cloud startup).
 We import pandas/requests only inside functions.
 """
 
+import functools
 from pathlib import Path
-from typing import Optional, Any
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional, Tuple
 
 
-def _find_column(df: Any, exact: Optional[str], *subs) -> Optional[str]:
-    """Find column by exact name or by substrings (all must match, case-insensitive)."""
-    df_cols = [str(c).strip() for c in df.columns]
-    if exact and exact in df_cols:
+class LoadStats(NamedTuple):
+    """Row counts attached to loader output as df.attrs["load_stats"] (built once, at the end)."""
+
+    source_rows: int = 0
+    loaded_rows: int = 0
+    kept_rows_before_dedup: int = 0
+    skipped_missing_name: int = 0
+    skipped_missing_member_id: int = 0
+    dropped_duplicate_member_id: int = 0
+    skipped_rows: int = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """dict-style access kept for callers that used the old stats dict."""
+        return getattr(self, key, default)
+
+
+def _column_index(columns: Any) -> List[Tuple[Any, str, str]]:
+    """Build (original, stripped, lowered) column names once per header for _find_column."""
+    out = []
+    for c in columns:
+        cs = str(c).strip()
+        out.append((c, cs, cs.lower()))
+    return out
+
+
+def _find_column(cols: List[Tuple[Any, str, str]], exact: Optional[str], *subs) -> Optional[str]:
+    """
+    Find column by exact name or by substrings (all must match, case-insensitive).
+    `cols` is the output of _column_index(columns).
+    """
+    if exact and any(cs == exact for _, cs, _ in cols):
         return exact
     low = exact.lower() if exact else ""
-    for c in df.columns:
-        cs = str(c).strip()
-        if exact and cs.lower() == low:
+    subs_low = [s.lower() for s in subs]
+    for c, _, cl in cols:
+        if exact and cl == low:
             return c
-        if subs and all(s.lower() in cs.lower() for s in subs):
+        if subs_low and all(s in cl for s in subs_low):
             return c
     return None
 
 
-def load_members_dataframe(path: str, sheet: str = "Sheet1") -> Any:
+# Every capitalisation of "nan" (as written by str(float("nan")) / spreadsheet exports), so the
+# check is a hashed isin() instead of lowercasing every cell.
+_NAN_SPELLINGS = tuple(a + b + c for a in "nN" for b in "aA" for c in "nN")
+
+# Cells read as missing by both CSV readers (pandas' default NA tokens). pyarrow's own default list
+# lacks "None" and "<NA>", so passing one list keeps a file's members independent of pyarrow.
+_CSV_NULL_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+@functools.lru_cache(maxsize=1)
+def _text_dtype() -> str:
+    """
+    pandas dtype for loaded text: "string[pyarrow]" when pyarrow is installed (values live in one
+    Arrow buffer instead of one Python str per cell), else the NumPy-backed "string".
+    """
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return "string"
+    return "string[pyarrow]"
+
+
+def _clean_text(s: Any) -> Any:
+    """Vectorized text normalization: stripped strings; missing values and literal "nan" become ""."""
+    text = s.astype(_text_dtype()).str.strip().fillna("")
+    return text.mask(text.isin(_NAN_SPELLINGS), "")
+
+
+def _int_or_blank(s: Any) -> Any:
+    """
+    Vectorized count normalization (Adult/Child): numbers become ints (truncated),
+    blanks (and literal "nan") become "", and any other text is kept stripped (so are
+    infinities and numbers outside the int64 range, which have no integer form).
+    When every value is numeric the column is downcast to the smallest integer dtype
+    (int8 for realistic counts) instead of an object column of Python ints.
+    """
+    import numpy as np
+    import pandas as pd
+
+    nums = pd.to_numeric(s, errors="coerce").astype("float64")
+    nums = nums.where(np.isfinite(nums) & (nums.abs() < 2.0**63))
+    ints = pd.Series(np.trunc(nums), index=s.index).astype("Int64")
+    if ints.notna().all():
+        return pd.to_numeric(ints.astype("int64"), downcast="integer")
+    return ints.astype(object).where(ints.notna(), _clean_text(s).astype(object))
+
+
+def _read_csv_as_strings_pyarrow(path: str, columns: List[str]) -> Any:
+    """
+    Read only `columns` of a CSV with pyarrow's multi-threaded C++ reader, every value as text.
+    (pandas' engine="pyarrow" infers types first and casts afterwards, which turns ID "001" into "1".)
+    Raises ImportError without pyarrow, or on input it rejects (e.g. duplicate header names).
+    """
+    import pandas as pd
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    table = pacsv.read_csv(
+        path,
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            column_types={c: pa.string() for c in columns},
+            null_values=_CSV_NULL_VALUES,
+            strings_can_be_null=True,
+        ),
+    )
+    # Arrow-backed string columns are handed over without building a Python str per cell.
+    return table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
+
+
+def _project_columns(df: Any, resolved: dict) -> Any:
+    """
+    Project df onto the fixed output schema. `resolved` maps output name -> source column
+    (or None); absent optional columns become a "" Series, so callers never branch on them.
+    """
+    import pandas as pd
+
+    return pd.DataFrame(
+        {out: df[src] if src else pd.Series("", index=df.index, dtype=object) for out, src in resolved.items()},
+        index=df.index,
+    )
+
+
+def _finalize_members(sub: Any, source_rows: int, seen_ids: Optional[set] = None) -> Any:
+    """
+    Normalize a frame already projected onto the output schema (see _project_columns), drop rows
+    without a name or member ID, keep the first row per Member_ID and attach load_stats.
+    Shared by every loader so CSV, Excel and AppSheet report the same counts.
+    seen_ids: Member_IDs kept by earlier chunks of the same file (updated in place), so chunked
+    loads drop duplicates across chunk boundaries too.
+    """
+    for col in ("Name", "Member_ID", "Membership_Type"):
+        sub[col] = _clean_text(sub[col])
+    sub["Adult"] = _int_or_blank(sub["Adult"])
+    sub["Child"] = _int_or_blank(sub["Child"])
+
+    name_ok = sub["Name"] != ""
+    mid_ok = sub["Member_ID"] != ""
+    missing_name = int((~name_ok).sum())
+    missing_member_id = int((name_ok & ~mid_ok).sum())
+
+    out = sub[name_ok & mid_ok]
+    before_dedup = len(out)
+    dup_mask = out["Member_ID"].duplicated(keep="first")
+    if seen_ids is not None:
+        dup_mask |= out["Member_ID"].isin(list(seen_ids))
+        seen_ids.update(out.loc[~dup_mask, "Member_ID"].tolist())
+    dropped_duplicates = int(dup_mask.sum())
+    out = out.loc[~dup_mask].reset_index(drop=True)
+    out.attrs["load_stats"] = LoadStats(
+        source_rows=source_rows,
+        loaded_rows=len(out),
+        kept_rows_before_dedup=before_dedup,
+        skipped_missing_name=missing_name,
+        skipped_missing_member_id=missing_member_id,
+        dropped_duplicate_member_id=dropped_duplicates,
+        skipped_rows=missing_name + missing_member_id,
+    )
+    return out
+
+
+def _resolve_excel_columns(headers: List[str]) -> dict:
+    """
+    Map the output schema to Excel header names (None for absent optional columns).
+    Raises ValueError when no Member ID column can be found.
+    """
+    cols = _column_index(headers)
+    name_col = (
+        _find_column(cols, "Full Name")
+        or _find_column(cols, "Member Name")
+        or _find_column(cols, None, "full", "name")
+        or _find_column(cols, None, "name")
+        or (headers[0] if headers else None)
+    )
+    member_id_col = (
+        _find_column(cols, "Member ID")
+        or _find_column(cols, "Unique Member ID")
+        or _find_column(cols, None, "member", "id")
+        or next(
+            (c for c, _, cl in cols if ("member" in cl and "id" in cl) or "member id" in cl),
+            None,
+        )
+    )
+    if not member_id_col:
+        raise ValueError(
+            "Could not find a Member ID column in the Excel sheet. "
+            "Expected something like 'Member ID' or 'Unique Member ID'. "
+            f"Columns: {list(headers)}"
+        )
+    membership_col = (
+        _find_column(cols, "Membership Type")
+        or _find_column(cols, None, "membership", "type")
+        or _find_column(cols, None, "membership")
+    )
+    adult_col = _find_column(cols, "Adult") or _find_column(cols, None, "adult")
+    child_col = _find_column(cols, "Child") or _find_column(cols, "Kids") or _find_column(cols, None, "child")
+    return {
+        "Name": name_col,
+        "Member_ID": member_id_col,
+        "Membership_Type": membership_col,
+        "Adult": adult_col,
+        "Child": child_col,
+    }
+
+
+def _read_xlsx_fast(path: str, sheet: str, usecols: Optional[Callable[[List[str]], Any]] = None) -> Any:
+    """
+    Read an .xlsx sheet with openpyxl in read-only, values-only mode.
+    Streams rows into per-column lists (no Cell objects); fully empty rows are skipped.
+    `usecols(headers)` returns the header names to keep (first occurrence); other cells are never copied.
+    """
+    import pandas as pd
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows_iter = wb[sheet].iter_rows(values_only=True)
+        header = next(rows_iter, None) or ()
+        headers = [str(h).strip() if h is not None else f"Unnamed: {i}" for i, h in enumerate(header)]
+        n = len(headers)
+        if usecols is None:
+            keep = list(range(n))
+        else:
+            wanted = set(usecols(headers))
+            keep = [i for i, h in enumerate(headers) if h in wanted and headers.index(h) == i]
+        columns: List[list] = [[] for _ in keep]
+        for row in rows_iter:
+            if all(v is None for v in row):
+                continue
+            if len(row) < n:
+                row = tuple(row) + (None,) * (n - len(row))
+            for col, i in zip(columns, keep):
+                col.append(row[i])
+    finally:
+        wb.close()
+    df = pd.DataFrame(dict(enumerate(columns)))
+    df.columns = [headers[i] for i in keep]
+    return df
+
+
+def load_members_dataframe(path: Any, sheet: str = "Sheet1") -> Any:
     """
     Load members from Excel or CSV into a DataFrame with columns:
     Name, Member_ID, Membership_Type, Adult, Child.
+
+    path may also be a seekable file-like object (e.g. io.StringIO), which is read as CSV.
+    For large CSV exports, iter_members_csv yields the same frames in bounded chunks.
     """
     import pandas as pd
 
-    p = Path(path)
-    suf = p.suffix.lower()
+    # File-like input: remember where it starts, since the header and the data are read separately.
+    start = path.tell() if hasattr(path, "read") else None
+    suf = ".csv" if start is not None else Path(path).suffix.lower()
+
+    def _rewind() -> None:
+        if start is not None:
+            path.seek(start)
     if suf in (".xlsx", ".xls"):
+        # Resolve the five columns from the header row first, then load only those.
+        df = None
+        if suf == ".xlsx":
+            resolved_fast: dict = {}
+
+            def _usecols(headers: List[str]) -> List[str]:
+                resolved_fast.update(_resolve_excel_columns(headers))
+                return [c for c in resolved_fast.values() if c]
+
+            try:
+                df = _read_xlsx_fast(path, sheet, usecols=_usecols)
+                resolved = resolved_fast
+            except Exception:
+                df = None  # fall back to pandas (also produces the friendly errors below)
         try:
-            df = pd.read_excel(path, sheet_name=sheet)
+            if df is None:
+                headers = [str(c).strip() for c in pd.read_excel(path, sheet_name=sheet, nrows=0).columns]
+                resolved = _resolve_excel_columns(headers)
+                wanted = {c for c in resolved.values() if c}
+                # dtype=str skips float/NaN inference; counts are re-parsed by _int_or_blank anyway.
+                df = pd.read_excel(path, sheet_name=sheet, usecols=lambda c: str(c).strip() in wanted, dtype=str)
         except ImportError as e:
             if "openpyxl" in str(e).lower():
                 raise ImportError(
@@ -45,145 +303,150 @@ def load_members_dataframe(path: str, sheet: str = "Sheet1") -> Any:
             raise
 
         df.columns = [str(c).strip() for c in df.columns]
-        name_col = (
-            _find_column(df, "Full Name")
-            or _find_column(df, "Member Name")
-            or _find_column(df, None, "full", "name")
-            or _find_column(df, None, "name")
-            or df.columns[0]
+        return _finalize_members(_project_columns(df, resolved), len(df))
+
+    # CSV: resolve columns from the header row, then read only those columns as strings
+    # (keeps numeric-looking member IDs intact and skips dtype inference).
+    raw_header, resolved = _resolve_csv_columns(path)
+    wanted = {c for c in resolved.values() if c}
+    _rewind()
+    try:
+        df = _read_csv_as_strings_pyarrow(path, [c for c in raw_header if str(c).strip() in wanted])
+    except Exception:
+        # pyarrow not installed, or input it rejects (e.g. duplicate header names): use the C parser
+        _rewind()
+        df = pd.read_csv(
+            path,
+            usecols=lambda c: str(c).strip() in wanted,
+            dtype=_text_dtype(),
+            na_values=_CSV_NULL_VALUES,
+            keep_default_na=False,
         )
-        member_id_col = (
-            _find_column(df, "Member ID")
-            or _find_column(df, "Unique Member ID")
-            or _find_column(df, None, "member", "id")
-            or next(
-                (
-                    c
-                    for c in df.columns
-                    if ("member" in str(c).lower() and "id" in str(c).lower())
-                    or "member id" in str(c).lower()
-                ),
-                None,
-            )
-        )
-        if not member_id_col:
-            raise ValueError(
-                "Could not find a Member ID column in the Excel sheet. "
-                "Expected something like 'Member ID' or 'Unique Member ID'. "
-                f"Columns: {list(df.columns)}"
-            )
-        membership_col = (
-            _find_column(df, "Membership Type")
-            or _find_column(df, None, "membership", "type")
-            or _find_column(df, None, "membership")
-        )
-        adult_col = _find_column(df, "Adult") or _find_column(df, None, "adult")
-        child_col = _find_column(df, "Child") or _find_column(df, "Kids") or _find_column(df, None, "child")
+    return _normalize_csv_members(df, resolved)
 
-        total_rows = len(df)
-        missing_name = 0
-        missing_member_id = 0
-        rows = []
 
-        def _to_int(v):
-            try:
-                if v is None or (isinstance(v, float) and str(v) == "nan"):
-                    return ""
-                if isinstance(v, str) and not v.strip():
-                    return ""
-                return int(float(v))
-            except Exception:
-                return str(v).strip()
+def iter_members_csv(path: Any, chunksize: int = 10_000) -> Iterator[Any]:
+    """
+    Load members from a CSV in chunks, yielding DataFrames with the same columns and cleaning
+    as load_members_dataframe, so large exports can be processed with a bounded working set.
 
-        for _, r in df.iterrows():
-            name = str(r.get(name_col, "") or "").strip()
-            if not name or name.lower() == "nan":
-                missing_name += 1
-                continue
-            mid = str(r.get(member_id_col, "") or "").strip()
-            if not mid or mid.lower() == "nan":
-                missing_member_id += 1
-                continue
-            membership_type = ""
-            if membership_col:
-                membership_type = str(r.get(membership_col, "") or "").strip()
-                if membership_type.lower() == "nan":
-                    membership_type = ""
-            adult_val = r.get(adult_col, "") if adult_col else ""
-            child_val = r.get(child_col, "") if child_col else ""
-            rows.append(
-                {
-                    "Name": name,
-                    "Member_ID": mid,
-                    "Membership_Type": membership_type,
-                    "Adult": _to_int(adult_val),
-                    "Child": _to_int(child_val),
-                }
-            )
+    Each chunk is built from at most chunksize source rows and carries its own load_stats.
+    Member_IDs already kept by an earlier chunk are dropped (counted as duplicates).
+    path may be a seekable file-like object. The file stays open until the iterator is
+    exhausted or close()d.
+    """
+    import pandas as pd
 
-        out = pd.DataFrame(rows)
-        before_dedup = len(out)
-        out = out.drop_duplicates(subset=["Member_ID"]).reset_index(drop=True)
-        out.attrs["load_stats"] = {
-            "source_rows": total_rows,
-            "kept_rows_before_dedup": before_dedup,
-            "loaded_rows": len(out),
-            "skipped_missing_name": missing_name,
-            "skipped_missing_member_id": missing_member_id,
-            "dropped_duplicate_member_id": before_dedup - len(out),
-        }
-        return out
+    start = path.tell() if hasattr(path, "read") else None
+    _, resolved = _resolve_csv_columns(path)
+    wanted = {c for c in resolved.values() if c}
+    if start is not None:
+        path.seek(start)
+    seen_ids: set = set()
+    with pd.read_csv(
+        path,
+        usecols=lambda c: str(c).strip() in wanted,
+        dtype=_text_dtype(),
+        na_values=_CSV_NULL_VALUES,
+        keep_default_na=False,
+        chunksize=chunksize,
+    ) as reader:
+        for chunk in reader:
+            yield _normalize_csv_members(chunk, resolved, seen_ids)
+
+
+def _resolve_csv_columns(path: Any) -> Tuple[List[Any], dict]:
+    """
+    Read only the CSV header row and map the output schema to its columns (None for absent
+    optional columns). Returns (raw header, mapping). Raises ValueError without a member ID column.
+    """
+    import pandas as pd
 
-    # CSV
-    df = pd.read_csv(path)
-    df.columns = [str(c).strip() for c in df.columns]
-    name_col = "Name" if "Name" in df.columns else next(
-        (c for c in df.columns if "name" in c.lower() or "first" in c.lower()), df.columns[0]
+    raw_header = list(pd.read_csv(path, nrows=0).columns)
+    header = [str(c).strip() for c in raw_header]
+    name_col = "Name" if "Name" in header else next(
+        (c for c in header if "name" in c.lower() or "first" in c.lower()), header[0]
     )
-    id_col = "Member_ID" if "Member_ID" in df.columns else next(
-        (c for c in df.columns if "member" in c.lower() or "id" in c.lower()),
-        df.columns[1] if len(df.columns) > 1 else None,
+    id_col = "Member_ID" if "Member_ID" in header else next(
+        (c for c in header if "member" in c.lower() or "id" in c.lower()),
+        header[1] if len(header) > 1 else None,
     )
     if id_col is None:
         raise ValueError("CSV must have a member ID column.")
 
     membership_col = (
         "Membership_Type"
-        if "Membership_Type" in df.columns
-        else next((c for c in df.columns if "membership" in c.lower()), None)
+        if "Membership_Type" in header
+        else next((c for c in header if "membership" in c.lower()), None)
     )
-    adult_col = "Adult" if "Adult" in df.columns else next((c for c in df.columns if c.lower() == "adult"), None)
-    child_col = "Child" if "Child" in df.columns else next((c for c in df.columns if c.lower() in ("child", "kids")), None)
-
-    df = df.rename(columns={name_col: "Name", id_col: "Member_ID"})
-    if membership_col and membership_col in df.columns and membership_col != "Membership_Type":
-        df = df.rename(columns={membership_col: "Membership_Type"})
-    if "Membership_Type" not in df.columns:
-        df["Membership_Type"] = ""
-    if adult_col and adult_col in df.columns and adult_col != "Adult":
-        df = df.rename(columns={adult_col: "Adult"})
-    if child_col and child_col in df.columns and child_col != "Child":
-        df = df.rename(columns={child_col: "Child"})
-    if "Adult" not in df.columns:
-        df["Adult"] = ""
-    if "Child" not in df.columns:
-        df["Child"] = ""
-
-    total_rows = len(df)
-    df = df[
-        df["Name"].notna()
-        & (df["Name"].astype(str).str.strip() != "")
-        & df["Member_ID"].notna()
-        & (df["Member_ID"].astype(str).str.strip() != "")
-    ]
-    df["Membership_Type"] = df["Membership_Type"].fillna("").astype(str)
-    out = df[["Name", "Member_ID", "Membership_Type", "Adult", "Child"]].reset_index(drop=True)
-    out.attrs["load_stats"] = {
-        "source_rows": total_rows,
-        "loaded_rows": len(out),
-        "skipped_rows": total_rows - len(out),
+    adult_col = "Adult" if "Adult" in header else next((c for c in header if c.lower() == "adult"), None)
+    child_col = "Child" if "Child" in header else next((c for c in header if c.lower() in ("child", "kids")), None)
+
+    return raw_header, {
+        "Name": name_col,
+        "Member_ID": id_col,
+        "Membership_Type": membership_col,
+        "Adult": adult_col,
+        "Child": child_col,
     }
-    return out
+
+
+def _normalize_csv_members(df: Any, resolved: dict, seen_ids: Optional[set] = None) -> Any:
+    """Project a raw CSV frame onto the output schema, then clean, filter and dedup it (_finalize_members)."""
+    df.columns = [str(c).strip() for c in df.columns]
+    return _finalize_members(_project_columns(df, resolved), len(df), seen_ids)
+
+
+# Shared HTTP session for AppSheet calls: keep-alive reuses one TCP/TLS connection across
+# retries and key-placement variants. Created lazily so requests is only imported when used.
+_SESSION: Any = None
+
+# Transient AppSheet statuses worth another attempt, and the base of the exponential backoff.
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_BACKOFF_S = 0.5
+
+
+def _get_session() -> Any:
+    """Return the module-level requests.Session (created on first use)."""
+    global _SESSION
+    if _SESSION is None:
+        try:
+            import requests  # type: ignore
+            from requests.adapters import HTTPAdapter
+        except Exception as e:  # pragma: no cover
+            raise ImportError(
+                "AppSheet integration requires 'requests'. Install it with:\n"
+                "  pip install requests\n"
+                "Or: pip install -r requirements.txt"
+            ) from e
+        session = requests.Session()
+        # No adapter-level retries: urllib3's Retry cannot see a call's overall deadline (each
+        # attempt would get the full timeout and Retry-After sleeps are uncapped), so
+        # load_members_dataframe_appsheet retries itself between attempts.
+        session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+        session.headers.update(
+            {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "User-Agent": "ctba-membership-card/1.0",
+            }
+        )
+        _SESSION = session
+    return _SESSION
+
+
+def _retry_delay_s(resp: Any, attempt: int) -> float:
+    """
+    Seconds to wait before retry number attempt + 1: the response's Retry-After (in seconds)
+    when present, else exponential backoff. Callers cap it against their deadline.
+    """
+    retry_after = (getattr(resp, "headers", None) or {}).get("Retry-After") if resp is not None else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            pass  # HTTP-date form: fall back to backoff
+    return _RETRY_BACKOFF_S * (2**attempt)
 
 
 def load_members_dataframe_appsheet(
@@ -192,19 +455,35 @@ def load_members_dataframe_appsheet(
     table_name: str,
     application_access_key: str,
     region: str = "www.appsheet.com",
+    selector: Optional[str] = None,
+    run_as_user_email: Optional[str] = None,
     timeout_s: int = 30,
-    max_attempts: int = 2,
+    max_attempts: int = 3,
+    max_inflight: int = 4,
+    session: Any = None,
 ) -> Any:
     """
     Load members from AppSheet REST API into a DataFrame with columns:
     Name, Member_ID, Membership_Type, Adult, Child.
+
+    Uses the AppSheet "Find" action:
+      POST https://{region}/api/v2/apps/{appId}/tables/{tableName}/Action?applicationAccessKey=...
+
+    selector / run_as_user_email: optional "Find" properties (Selector expression, RunAsUserEmail).
+    timeout_s is an overall budget for the whole load: retries and fallbacks stop once it is spent.
+    Connection errors and transient statuses (429/5xx) get up to max_attempts attempts per request,
+    waiting for Retry-After (or exponential backoff) only when that wait still fits the budget.
+    max_inflight caps concurrent requests when probing the empty-body fallbacks.
+    session: a requests.Session-like object to use instead of the shared module session.
     """
-    import random
     import time
+    from concurrent.futures import ThreadPoolExecutor, as_completed
     from urllib.parse import quote
 
     import pandas as pd
-    import requests
+
+    if session is None:
+        session = _get_session()
 
     app_id = (app_id or "").strip()
     table_name = (table_name or "").strip()
@@ -213,18 +492,21 @@ def load_members_dataframe_appsheet(
     if not app_id or not table_name or not application_access_key:
         raise ValueError("AppSheet requires app_id, table_name, and application_access_key.")
 
+    # AppSheet supports key in header (preferred) or query string (less secure).
+    # We'll try a few variants because some deployments behave inconsistently.
     params_query = {"applicationAccessKey": application_access_key}
-    headers_value = {
-        "Accept": "application/json",
-        "Content-Type": "application/json",
-        "ApplicationAccessKey": application_access_key,
-        "User-Agent": "ctba-membership-card/1.0",
-    }
-    headers_assignment = {
-        **{k: v for k, v in headers_value.items() if k != "ApplicationAccessKey"},
-        "ApplicationAccessKey": f"ApplicationAccessKey={application_access_key}",
-    }
+    # Accept/Content-Type/User-Agent live on the shared session; variants only vary key placement.
+    headers_value = {"ApplicationAccessKey": application_access_key}
+    # Some examples/documentation show "ApplicationAccessKey=<key>" as the header value.
+    headers_assignment = {"ApplicationAccessKey": f"ApplicationAccessKey={application_access_key}"}
     body: dict = {"Action": "Find", "Properties": {"Locale": "en-US", "Timezone": "UTC"}, "Rows": []}
+    if selector:
+        body["Properties"]["Selector"] = selector
+    if run_as_user_email:
+        body["Properties"]["RunAsUserEmail"] = run_as_user_email
+
+    # One wall-clock budget for the whole load (retries, variants and domain fallback included).
+    deadline = time.monotonic() + max(1, int(timeout_s))
 
     def _call(region_domain: str, *, mode: str):
         endpoint = f"https://{region_domain}/api/v2/apps/{app_id}/tables/{quote(table_name, safe='')}/Action"
@@ -235,36 +517,45 @@ def load_members_dataframe_appsheet(
             headers = headers_assignment
             params = None
         elif mode == "query_only":
-            headers = {k: v for k, v in headers_value.items() if k != "ApplicationAccessKey"}
+            headers = None
             params = params_query
         else:
+            # default: include both (header wins if both supplied)
             headers = headers_value
             params = params_query
-
+        # Retry connection errors and transient statuses while the budget lasts; after that the
+        # last response is returned as-is (and reported by the status checks below).
+        attempts = max(1, int(max_attempts))
+        resp = None
         last_exc: Optional[Exception] = None
-        last_resp = None
-        for attempt in range(max(1, int(max_attempts))):
+        for attempt in range(attempts):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
             try:
-                resp = requests.post(
+                resp = session.post(
                     endpoint,
                     params=params,
                     headers=headers,
                     json=body,
-                    timeout=(10, max(10, int(timeout_s))),
+                    timeout=(min(10.0, remaining), remaining),
                     allow_redirects=False,
                 )
-                last_resp = resp
-                if resp.status_code in (429, 500, 502, 503):
-                    time.sleep(min(6.0, 0.6 * (2**attempt) + random.random() * 0.25))
-                    continue
-                return endpoint, resp
             except Exception as e:
-                last_exc = e
-                time.sleep(min(6.0, 0.6 * (2**attempt) + random.random() * 0.25))
-                continue
-        if last_resp is not None:
-            return endpoint, last_resp
-        raise RuntimeError(f"AppSheet request failed after retries: {last_exc}") from last_exc
+                resp, last_exc = None, e
+            else:
+                if resp.status_code not in _RETRY_STATUSES:
+                    return endpoint, resp
+            if attempt + 1 < attempts:
+                delay = _retry_delay_s(resp, attempt)
+                if time.monotonic() + delay >= deadline:
+                    break  # the wait alone would overrun the budget
+                time.sleep(delay)
+        if resp is not None:
+            return endpoint, resp
+        if last_exc is not None:
+            raise RuntimeError(f"AppSheet request failed after retries: {last_exc}") from last_exc
+        raise RuntimeError(f"AppSheet request timed out (no time left of the {timeout_s}s budget).")
 
     endpoint, resp = _call(region, mode="both")
 
@@ -280,46 +571,85 @@ def load_members_dataframe_appsheet(
             f"Body (first 500 chars): {snippet}"
         )
 
+    # Common failure mode: HTML/redirect response instead of JSON.
     if resp.status_code in (301, 302, 303, 307, 308):
         _raise_with_response("AppSheet API redirect", endpoint, resp)
+
+    # Another failure mode seen in the wild: 200 OK with an empty body.
+    # We'll retry with a few key-placement/header variants and (if needed) api.appsheet.com.
+    # The probes are I/O-bound, so run them concurrently and take the first non-empty 200.
     if resp.status_code == 200 and not (resp.content or b""):
-        # retry other auth modes/domain
+        variants = [(region, mode) for mode in ("header_value", "query_only", "header_assignment")]
+        if region != "api.appsheet.com":
+            variants += [("api.appsheet.com", mode) for mode in ("both", "header_value", "query_only", "header_assignment")]
         tried = [(endpoint, resp)]
-        for mode in ("header_value", "query_only", "header_assignment"):
-            endpoint2, resp2 = _call(region, mode=mode)
-            tried.append((endpoint2, resp2))
-            if resp2.status_code == 200 and (resp2.content or b""):
-                endpoint, resp = endpoint2, resp2
-                break
+        found = None
+        first_exc: Optional[Exception] = None
+        executor = ThreadPoolExecutor(max_workers=max(1, min(int(max_inflight), len(variants))))
+        try:
+            futures = [executor.submit(_call, domain, mode=mode) for domain, mode in variants]
+            for fut in as_completed(futures):
+                try:
+                    endpoint2, resp2 = fut.result()
+                except Exception as e:
+                    first_exc = first_exc or e
+                    continue
+                tried.append((endpoint2, resp2))
+                if resp2.status_code == 200 and (resp2.content or b""):
+                    found = (endpoint2, resp2)
+                    break
+        finally:
+            # Don't wait for slower probes once one has succeeded (they are bounded by the deadline).
+            executor.shutdown(wait=False, cancel_futures=True)
+        if found is not None:
+            endpoint, resp = found
+        elif first_exc is not None and len(tried) == 1:
+            raise first_exc
         else:
-            if region != "api.appsheet.com":
-                for mode in ("both", "header_value", "query_only", "header_assignment"):
-                    endpoint3, resp3 = _call("api.appsheet.com", mode=mode)
-                    tried.append((endpoint3, resp3))
-                    if resp3.status_code == 200 and (resp3.content or b""):
-                        endpoint, resp = endpoint3, resp3
-                        break
-                else:
-                    last_ep, last_resp = tried[-1]
-                    _raise_with_response(
-                        "AppSheet returned empty response body after retries. Check API enabled/key/plan",
-                        last_ep,
-                        last_resp,
-                    )
-            else:
-                _raise_with_response(
-                    "AppSheet returned empty response body after retries. Check API enabled/key/plan",
-                    endpoint,
-                    resp,
-                )
+            # All attempts returned empty
+            last_ep, last_resp = tried[-1]
+            _raise_with_response(
+                "AppSheet returned empty response body after retries. "
+                "Check that the API is enabled for the app, the access key is valid, "
+                "and your plan supports the AppSheet API",
+                last_ep,
+                last_resp,
+            )
+
     if resp.status_code != 200:
         if resp.status_code == 403:
-            _raise_with_response("AppSheet API forbidden (403). Check API enabled/key/plan", endpoint, resp)
+            _raise_with_response(
+                "AppSheet API forbidden (403). Check: API enabled for app, access key valid, and plan supports API",
+                endpoint,
+                resp,
+            )
         if resp.status_code == 404:
-            _raise_with_response("AppSheet API not found (404). Check App ID/Table name", endpoint, resp)
+            _raise_with_response(
+                "AppSheet API not found (404). Check: App ID and Table name",
+                endpoint,
+                resp,
+            )
         _raise_with_response("AppSheet API error", endpoint, resp)
 
-    data = resp.json()
+    try:
+        # Parse the already-buffered body bytes directly (the empty-body check and diagnostics need
+        # them anyway, so stream=True would not lower peak memory). orjson (optional) parses large
+        # tables noticeably faster than stdlib json, which also accepts bytes.
+        try:
+            import orjson  # type: ignore
+        except ImportError:
+            import json
+
+            data = json.loads(resp.content)
+        else:
+            data = orjson.loads(resp.content)
+    except Exception as e:
+        # Re-raise with helpful response diagnostics, preserving original exception context
+        try:
+            _raise_with_response("AppSheet response was not valid JSON", endpoint, resp)
+        except Exception as raised:
+            raise raised from e
+    # AppSheet usually returns: {"Rows": [ ... ]}, but some setups return a raw list.
     if isinstance(data, list):
         rows = data
     elif isinstance(data, dict):
@@ -329,64 +659,65 @@ def load_members_dataframe_appsheet(
     if not isinstance(rows, list):
         raise RuntimeError("Unexpected AppSheet response: missing 'Rows' list.")
 
-    df = pd.DataFrame(rows)
-    if df.empty:
+    # Resolve columns from the row keys (union, in first-seen order; AppSheet rows normally all
+    # share one key set, so this is one dict comparison per row).
+    keys: dict = {}
+    for r in rows:
+        if not isinstance(r, dict):
+            raise RuntimeError(f"Unexpected AppSheet row type: {type(r).__name__}")
+        if r.keys() != keys.keys():
+            keys.update(dict.fromkeys(r))
+    if not keys:
         out = pd.DataFrame(columns=["Name", "Member_ID", "Membership_Type", "Adult", "Child"])
-        out.attrs["load_stats"] = {"source_rows": 0, "loaded_rows": 0}
+        out.attrs["load_stats"] = LoadStats()
         return out
 
-    df.columns = [str(c).strip() for c in df.columns]
+    # Map columns similarly to the enriched Excel (on stripped names; raw_key maps back to row keys)
+    raw_key: dict = {}
+    for k in keys:
+        raw_key.setdefault(str(k).strip(), k)
+    cols = _column_index(raw_key)
     name_col = (
-        _find_column(df, "Full Name")
-        or _find_column(df, "Member Name")
-        or _find_column(df, None, "full", "name")
-        or _find_column(df, None, "name")
-        or df.columns[0]
+        _find_column(cols, "Full Name")
+        or _find_column(cols, "Member Name")
+        or _find_column(cols, None, "full", "name")
+        or _find_column(cols, None, "name")
+        or next(iter(raw_key))
     )
     member_id_col = (
-        _find_column(df, "Member ID")
-        or _find_column(df, "Member_ID")
-        or _find_column(df, "Unique Member ID")
-        or _find_column(df, None, "member", "id")
+        _find_column(cols, "Member ID")
+        or _find_column(cols, "Member_ID")
+        or _find_column(cols, "Unique Member ID")
+        or _find_column(cols, None, "member", "id")
     )
     if not member_id_col:
-        raise ValueError(f"Could not find a Member ID column in AppSheet rows. Columns: {list(df.columns)}")
+        raise ValueError(f"Could not find a Member ID column in AppSheet rows. Columns: {list(raw_key)}")
 
     membership_col = (
-        _find_column(df, "Membership Type")
-        or _find_column(df, "Membership_Type")
-        or _find_column(df, None, "membership", "type")
-        or _find_column(df, None, "membership")
+        _find_column(cols, "Membership Type")
+        or _find_column(cols, "Membership_Type")
+        or _find_column(cols, None, "membership", "type")
+        or _find_column(cols, None, "membership")
+    )
+    adult_col = _find_column(cols, "Adult") or _find_column(cols, None, "adult")
+    child_col = _find_column(cols, "Child") or _find_column(cols, "Kids") or _find_column(cols, None, "child")
+
+    # Build the five output columns straight from the rows; pd.DataFrame(rows) would first
+    # materialise every table column (AppSheet rows carry all of them) only to project them away.
+    blank = [""] * len(rows)
+    out = pd.DataFrame(
+        {
+            dst: [r.get(raw_key[src]) for r in rows] if src is not None else blank
+            for dst, src in (
+                ("Name", name_col),
+                ("Member_ID", member_id_col),
+                ("Membership_Type", membership_col),
+                ("Adult", adult_col),
+                ("Child", child_col),
+            )
+        },
+        dtype=object,
     )
-    adult_col = _find_column(df, "Adult") or _find_column(df, None, "adult")
-    child_col = _find_column(df, "Child") or _find_column(df, "Kids") or _find_column(df, None, "child")
-
-    out = df.rename(columns={name_col: "Name", member_id_col: "Member_ID"}).copy()
-    if membership_col and membership_col in out.columns and membership_col != "Membership_Type":
-        out = out.rename(columns={membership_col: "Membership_Type"})
-    if "Membership_Type" not in out.columns:
-        out["Membership_Type"] = ""
-    if adult_col and adult_col in out.columns and adult_col != "Adult":
-        out = out.rename(columns={adult_col: "Adult"})
-    if child_col and child_col in out.columns and child_col != "Child":
-        out = out.rename(columns={child_col: "Child"})
-    if "Adult" not in out.columns:
-        out["Adult"] = ""
-    if "Child" not in out.columns:
-        out["Child"] = ""
-
-    total_rows = len(out)
-    out["Name"] = out["Name"].fillna("").astype(str).str.strip()
-    out["Member_ID"] = out["Member_ID"].fillna("").astype(str).str.strip()
-    out = out[(out["Name"] != "") & (out["Member_ID"] != "")]
-    before_dedup = len(out)
-    out = out.drop_duplicates(subset=["Member_ID"]).reset_index(drop=True)
-    out = out[["Name", "Member_ID", "Membership_Type", "Adult", "Child"]]
-    out.attrs["load_stats"] = {
-        "source_rows": total_rows,
-        "kept_rows_before_dedup": before_dedup,
-        "loaded_rows": len(out),
-        "dropped_duplicate_member_id": before_dedup - len(out),
-    }
-    return out
 
+    # Same normalization as the file loaders (AppSheet often returns counts as strings, e.g. "2").
+    return _finalize_members(out, len(out))
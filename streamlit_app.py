@@ -19,6 +19,9 @@ _log("imported streamlit")
 
 try:
     # Import the local ui.py explicitly (avoid name collisions with any installed "ui" package).
+    # This must stay an exec on every rerun: ui.py is a Streamlit script, and a plain `import ui`
+    # would be served from sys.modules after the first run and render nothing on later reruns.
+    # (The source compiles once; the loader reuses __pycache__/ui.*.pyc.)
     _log("loading local ui.py")
     import importlib.util
     import sys
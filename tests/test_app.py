@@ -0,0 +1,62 @@
+import io
+import re
+import zlib
+
+import pytest
+
+import app
+
+
+def _card_pdf():
+    from PIL import Image
+
+    generator = app.MembershipCardGenerator("", "")
+    img = Image.new("RGB", (generator._card_w_px, generator._card_h_px), (229, 226, 209))
+    img.paste((0, 0, 0), (10, 20, 110, 220))
+    return img, generator.create_pdf_bytes(img)
+
+
+def test_create_pdf_bytes_xref_points_at_every_object():
+    _, pdf = _card_pdf()
+    assert pdf.startswith(b"%PDF-1.4\n") and pdf.endswith(b"%%EOF\n")
+
+    xref_at = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", pdf).group(1))
+    assert pdf[xref_at:].startswith(b"xref\n0 6\n0000000000 65535 f \n")
+    entries = pdf[xref_at + len(b"xref\n0 6\n") :].split(b"trailer")[0]
+    assert len(entries) == 6 * 20  # fixed-width 20-byte entries
+    for num in range(1, 6):
+        entry = entries[num * 20 : (num + 1) * 20]
+        assert entry.endswith(b" 00000 n \n")
+        assert pdf[int(entry[:10]) :].startswith(b"%d 0 obj\n" % num)
+
+
+def test_create_pdf_bytes_embeds_pixels_losslessly():
+    img, pdf = _card_pdf()
+    assert b"/MediaBox [0 0 180 288]" in pdf
+    header = re.search(rb"/Width (\d+) /Height (\d+) .*?/Length (\d+) >>\nstream\n", pdf)
+    assert (int(header.group(1)), int(header.group(2))) == img.size
+    data = pdf[header.end() : header.end() + int(header.group(3))]
+    assert zlib.decompress(data) == img.tobytes()
+
+
+def test_create_pdf_bytes_round_trips_through_pypdf():
+    pypdf = pytest.importorskip("pypdf")
+
+    img, pdf = _card_pdf()
+    page = pypdf.PdfReader(io.BytesIO(pdf), strict=True).pages[0]
+    assert [float(v) for v in page.mediabox] == [0, 0, 180, 288]
+    (image,) = page.images
+    assert image.image.size == img.size
+    assert image.image.tobytes() == img.tobytes()
+
+
+def test_card_template_is_per_banner_content():
+    from PIL import Image
+
+    generator = app.MembershipCardGenerator("", "")
+    qr = generator.generate_qr_code("ID1", "Alice", size_px=generator.qr_size_px)
+    top = (generator._card_w_px // 2, 10)
+    for color in [(255, 0, 0), (0, 0, 255), (255, 0, 0)]:
+        banner = Image.new("RGB", (600, 200), color)
+        card = generator.create_card_image("Alice", "ID1", qr, banner)
+        assert card.getpixel(top) == color
@@ -1,18 +1,142 @@
+import io
+import json
 import tempfile
+import time
+
+import pytest
 
 import data_loaders as loaders
 
 
 def test_load_members_dataframe_csv_basic():
+    buf = io.StringIO("Name,Member_ID,Membership_Type,Adult,Child\nJohn Doe,ID123,Family,2,1\n")
+
+    df = loaders.load_members_dataframe(buf)
+    assert list(df.columns) == ["Name", "Member_ID", "Membership_Type", "Adult", "Child"]
+    assert len(df) == 1
+    assert df.iloc[0]["Member_ID"] == "ID123"
+    assert str(df["Adult"].dtype) == "int8" and str(df["Child"].dtype) == "int8"
+
+
+def test_load_members_dataframe_csv_keeps_non_integer_counts_as_text():
+    buf = io.StringIO("Name,Member_ID,Adult,Child\nA,1,inf,2\nB,2,-inf,1\nC,3,1e30,0\n")
+
+    df = loaders.load_members_dataframe(buf)
+    assert df["Adult"].tolist() == ["inf", "-inf", "1e30"]
+    assert df["Child"].tolist() == [2, 1, 0]
+
+
+def test_load_members_dataframe_csv_keeps_numeric_ids_as_text():
     with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
-        tmp.write("Name,Member_ID,Membership_Type,Adult,Child\n")
-        tmp.write("John Doe,ID123,Family,2,1\n")
+        tmp.write("Name,Member_ID,Adult\n")
+        tmp.write("John Doe,007,2\n")
         path = tmp.name
 
+    df = loaders.load_members_dataframe(path)
+    assert df.iloc[0]["Member_ID"] == "007"
+    assert df.iloc[0]["Adult"] == 2
+
+
+def test_load_members_dataframe_csv_treats_nan_text_as_blank():
+    buf = io.StringIO("Name,Member_ID,Membership_Type\nA,1,NAN\nB,2, nan \nC,3,Nan\nnan,4,Single\n")
+
+    df = loaders.load_members_dataframe(buf)
+    assert df["Member_ID"].tolist() == ["1", "2", "3"]
+    assert df["Membership_Type"].tolist() == ["", "", ""]
+
+
+def test_load_members_dataframe_csv_skips_and_counts():
+    buf = io.StringIO("Name,Member_ID\nAlice,ID1\n,ID2\nCarol,\nAlice Again,ID1\nDan,ID4\n")
+
+    df = loaders.load_members_dataframe(buf)
+    assert df["Member_ID"].tolist() == ["ID1", "ID4"]
+    stats = df.attrs["load_stats"]
+    assert stats.source_rows == 5 and stats.loaded_rows == 2
+    assert stats.skipped_missing_name == 1
+    assert stats.skipped_missing_member_id == 1
+    assert stats.dropped_duplicate_member_id == 1
+
+
+def test_load_members_dataframe_csv_null_tokens_match_without_pyarrow(monkeypatch):
+    pytest.importorskip("pyarrow")
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
+        tmp.write("Name,Member_ID,Membership_Type\n")
+        tmp.write("None,1,Single\n<NA>,2,Single\nAlice,3,N/A\nBob,4,NULL\nCarol,5,Family\n")
+        path = tmp.name
+
+    with_pyarrow = loaders.load_members_dataframe(path)
+
+    def _no_pyarrow(*args, **kwargs):
+        raise ImportError("pyarrow")
+
+    monkeypatch.setattr(loaders, "_read_csv_as_strings_pyarrow", _no_pyarrow)
+    without_pyarrow = loaders.load_members_dataframe(path)
+
+    assert with_pyarrow["Member_ID"].tolist() == ["3", "4", "5"]
+    assert with_pyarrow["Membership_Type"].tolist() == ["", "", "Family"]
+    assert with_pyarrow.equals(without_pyarrow)
+
+
+def test_iter_members_csv_chunks_match_full_load():
+    import pandas as pd
+
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as tmp:
+        tmp.write("Name,Member_ID,Adult\n")
+        tmp.write("A,1,2\n,2,1\nC,3,\nD,4,1\nE,5,0\n")
+        path = tmp.name
+
+    chunks = list(loaders.iter_members_csv(path, chunksize=2))
+    assert [c.attrs["load_stats"].source_rows for c in chunks] == [2, 2, 1]
+    assert pd.concat(chunks, ignore_index=True).equals(loaders.load_members_dataframe(path))
+
+
+def test_load_members_dataframe_excel_skips_and_counts():
+    import pandas as pd
+
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+        path = tmp.name
+    pd.DataFrame(
+        {
+            "Member ID": ["ID1", "ID2", None, "ID1", "ID4"],
+            "Full Name": ["Alice", "Bob", "Carol", "Alice Again", None],
+            "Membership Type": ["Family", None, "Single", "Family", "Single"],
+            "Adult": [2, None, 1, 2, 1],
+            "Child": [1.0, 0, None, 1, 0],
+        }
+    ).to_excel(path, sheet_name="Sheet1", index=False)
+
     df = loaders.load_members_dataframe(path)
     assert list(df.columns) == ["Name", "Member_ID", "Membership_Type", "Adult", "Child"]
-    assert len(df) == 1
-    assert df.iloc[0]["Member_ID"] == "ID123"
+    assert df["Member_ID"].tolist() == ["ID1", "ID2"]
+    assert df.iloc[0]["Adult"] == 2 and df.iloc[0]["Child"] == 1
+    assert df.iloc[1]["Adult"] == "" and df.iloc[1]["Membership_Type"] == ""
+    stats = df.attrs["load_stats"]
+    assert stats.skipped_missing_name == 1
+    assert stats.skipped_missing_member_id == 1
+    assert stats.dropped_duplicate_member_id == 1
+    assert stats.get("loaded_rows") == 2
+
+
+def test_load_members_dataframe_excel_treats_nan_text_as_blank():
+    import pandas as pd
+
+    with tempfile.NamedTemporaryFile(suffix=".xlsx", delete=False) as tmp:
+        path = tmp.name
+    pd.DataFrame(
+        {
+            "Member ID": ["ID1", "ID2", "nan"],
+            "Full Name": ["NaN", "Bob", "Carol"],
+            "Membership Type": ["Family", "nan", "Single"],
+        }
+    ).to_excel(path, sheet_name="Sheet1", index=False)
+
+    df = loaders.load_members_dataframe(path)
+    assert df["Member_ID"].tolist() == ["ID2"]
+    assert df.iloc[0]["Membership_Type"] == ""
+    stats = df.attrs["load_stats"]
+    assert stats.skipped_missing_name == 1
+    assert stats.skipped_missing_member_id == 1
 
 
 class _FakeResp:
@@ -20,14 +144,14 @@ class _FakeResp:
         self.status_code = status_code
         self._payload = payload
         self.headers = {}
-        self.content = b"{}"
+        self.content = json.dumps(payload).encode("utf-8")
         self.text = ""
 
     def json(self):
         return self._payload
 
 
-class _FakeRequests:
+class _FakeSession:
     def __init__(self, payload):
         self._payload = payload
 
@@ -35,44 +159,119 @@ class _FakeRequests:
         return _FakeResp(200, self._payload)
 
 
-def test_load_members_dataframe_appsheet_accepts_list_response(monkeypatch):
-    # Avoid sleeps in retry logic
-    monkeypatch.setattr(loaders, "time", type("T", (), {"sleep": staticmethod(lambda *_a, **_k: None)})(), raising=False)
-    # Inject fake requests into sys.modules so the loader's local import picks it up.
-    import sys
-    sys.modules["requests"] = _FakeRequests(
-        [
-            {
-                "Member ID": "ID1",
-                "Full Name": "Alice",
-                "Membership Type": "Family",
-                "Adult": 2,
-                "Child": 1,
-            }
-        ]
+_ALICE_ROW = {"Member ID": "ID1", "Full Name": "Alice", "Membership Type": "Family", "Adult": 2, "Child": "1"}
+_BOB_ROW = {"Member ID": "ID2", "Full Name": "Bob", "Membership Type": "Single", "Adult": 1, "Child": 0}
+
+
+@pytest.mark.parametrize(
+    "payload,expected",
+    [
+        ([_ALICE_ROW], ("ID1", 2, 1)),  # raw list of rows
+        ({"Rows": [_BOB_ROW]}, ("ID2", 1, 0)),  # {"Rows": [...]} envelope
+    ],
+    ids=["list", "dict_rows"],
+)
+def test_load_members_dataframe_appsheet_accepts_response_shapes(payload, expected):
+    # Inject a fake session so no real HTTP connection is made.
+    df = loaders.load_members_dataframe_appsheet(
+        app_id="app",
+        table_name="table",
+        application_access_key="key",
+        region="www.appsheet.com",
+        session=_FakeSession(payload),
     )
-    df = loaders.load_members_dataframe_appsheet(app_id="app", table_name="table", application_access_key="key", region="www.appsheet.com")
     assert len(df) == 1
-    assert df.iloc[0]["Member_ID"] == "ID1"
+    member_id, adult, child = expected
+    assert df.iloc[0]["Member_ID"] == member_id
+    assert df.iloc[0]["Adult"] == adult and df.iloc[0]["Child"] == child
 
 
-def test_load_members_dataframe_appsheet_accepts_dict_rows_response(monkeypatch):
-    monkeypatch.setattr(loaders, "time", type("T", (), {"sleep": staticmethod(lambda *_a, **_k: None)})(), raising=False)
-    import sys
-    sys.modules["requests"] = _FakeRequests(
-        {
-            "Rows": [
-                {
-                    "Member ID": "ID2",
-                    "Full Name": "Bob",
-                    "Membership Type": "Single",
-                    "Adult": 1,
-                    "Child": 0,
-                }
-            ]
-        }
+class _RecordingSession(_FakeSession):
+    def post(self, *args, json=None, **kwargs):
+        self.body = json
+        return super().post(*args, **kwargs)
+
+
+def test_load_members_dataframe_appsheet_passes_find_properties():
+    session = _RecordingSession([_ALICE_ROW])
+    loaders.load_members_dataframe_appsheet(
+        app_id="app",
+        table_name="table",
+        application_access_key="key",
+        selector="Filter(Members, [Active] = TRUE)",
+        run_as_user_email="admin@example.org",
+        session=session,
     )
-    df = loaders.load_members_dataframe_appsheet(app_id="app", table_name="table", application_access_key="key", region="www.appsheet.com")
-    assert len(df) == 1
-    assert df.iloc[0]["Member_ID"] == "ID2"
+    assert session.body["Action"] == "Find"
+    assert session.body["Properties"]["Selector"] == "Filter(Members, [Active] = TRUE)"
+    assert session.body["Properties"]["RunAsUserEmail"] == "admin@example.org"
+
+
+class _StatusSequenceSession:
+    """Answers each post with the next (status, headers) pair, after an optional delay."""
 
+    def __init__(self, statuses, payload, delay_s=0.0):
+        self._statuses = list(statuses)
+        self._payload = payload
+        self._delay_s = delay_s
+        self.calls = 0
+
+    def post(self, *args, **kwargs):
+        time.sleep(self._delay_s)
+        status, headers = self._statuses[min(self.calls, len(self._statuses) - 1)]
+        self.calls += 1
+        resp = _FakeResp(status, self._payload)
+        resp.headers = dict(headers)
+        return resp
+
+
+def test_load_members_dataframe_appsheet_retries_transient_statuses():
+    session = _StatusSequenceSession([(503, {"Retry-After": "0"}), (429, {"Retry-After": "0"}), (200, {})], [_ALICE_ROW])
+    df = loaders.load_members_dataframe_appsheet(
+        app_id="app", table_name="table", application_access_key="key", session=session
+    )
+    assert session.calls == 3
+    assert df["Member_ID"].tolist() == ["ID1"]
+
+
+def test_load_members_dataframe_appsheet_max_attempts_bounds_retries():
+    session = _StatusSequenceSession([(503, {"Retry-After": "0"})], [_ALICE_ROW])
+    with pytest.raises(RuntimeError, match="status: 503"):
+        loaders.load_members_dataframe_appsheet(
+            app_id="app", table_name="table", application_access_key="key", max_attempts=2, session=session
+        )
+    assert session.calls == 2
+
+
+def test_load_members_dataframe_appsheet_retry_after_respects_budget():
+    # Slow server asking for a long Retry-After: the wait would overrun timeout_s, so give up early.
+    session = _StatusSequenceSession([(503, {"Retry-After": "30"})], [_ALICE_ROW], delay_s=0.3)
+    start = time.monotonic()
+    with pytest.raises(RuntimeError, match="status: 503"):
+        loaders.load_members_dataframe_appsheet(
+            app_id="app", table_name="table", application_access_key="key", timeout_s=1, session=session
+        )
+    assert time.monotonic() - start < 1.0
+    assert session.calls == 1
+
+
+class _EmptyUnlessApiDomainSession:
+    """Returns 200 with an empty body except on api.appsheet.com (the domain fallback)."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def post(self, url, *args, **kwargs):
+        resp = _FakeResp(200, self._payload)
+        if "//api.appsheet.com/" not in url:
+            resp.content = b""
+        return resp
+
+
+def test_load_members_dataframe_appsheet_empty_body_falls_back_to_api_domain():
+    session = _EmptyUnlessApiDomainSession([{"Member ID": "ID3", "Full Name": "Carol"}])
+    df = loaders.load_members_dataframe_appsheet(
+        app_id="app", table_name="table", application_access_key="key", region="www.appsheet.com", session=session
+    )
+    assert df["Member_ID"].tolist() == ["ID3"]
+    assert df.iloc[0]["Adult"] == ""
@@ -1,4 +1,4 @@
-from utils import safe_pdf_filename
+from utils import safe_pdf_filename, safe_pdf_filenames
 
 
 def test_safe_pdf_filename_basic():
@@ -13,3 +13,11 @@ def test_safe_pdf_filename_empty_fallback():
     assert safe_pdf_filename("") == "member.pdf"
     assert safe_pdf_filename("   ") == "member.pdf"
 
+
+def test_safe_pdf_filenames_matches_scalar():
+    import pandas as pd
+
+    names = ["John Doe", "  A/B:C*D?  ", "", "   ", "Jöhn  Dœ", None, float("nan"), pd.NA]
+    expected = [safe_pdf_filename(n) for n in names]
+    assert expected[-3:] == ["member.pdf"] * 3
+    assert safe_pdf_filenames(pd.Series(names, dtype=object)).tolist() == expected
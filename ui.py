@@ -3,29 +3,33 @@
 Streamlit UI for CTBA Membership Card Generator
 """
 
+import hashlib
 import io
 import os
 import tempfile
-import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 import traceback
 import time
 
 import streamlit as st
 
-import pandas as pd
-
 from config import (
     MAX_INDIVIDUAL_DOWNLOADS,
+    MULTISELECT_MAX_OPTIONS,
     PREVIEW_COLUMNS_DESKTOP,
     PREVIEW_COLUMNS_MOBILE,
     PREVIEW_WIDTH_DESKTOP,
     PREVIEW_WIDTH_MOBILE,
+    RENDER_WORKERS,
     ZIP_SPOOL_MAX_BYTES,
 )
 from data_loaders import load_members_dataframe, load_members_dataframe_appsheet
-from utils import safe_pdf_filename
+from utils import safe_pdf_filenames
+
+if TYPE_CHECKING:
+    # pandas is imported lazily (~0.3s); the default AppSheet path only needs it once data is fetched
+    import pandas as pd
 
 _UI_DIR = Path(__file__).resolve().parent
 _FALLBACK_CSV = Path.home() / "Downloads" / "CTBA Annual Membership Mock Master List - Form Responses 1.csv"
@@ -110,35 +114,123 @@ if 'banner_path' not in st.session_state:
 if 'generated_count' not in st.session_state:
     st.session_state.generated_count = 0
 if "selected_member_ids" not in st.session_state:
-    # Track selection by Member_ID (stable across filtering/search)
+    # Track selection by Member_ID (stable across filtering/search); always a sorted list of str
     st.session_state.selected_member_ids = []
 if "search_term" not in st.session_state:
     # Applied search term (use a form to avoid rerun-per-keystroke)
     st.session_state.search_term = ""
 if "generated_items" not in st.session_state:
-    # For <=10: list of {name, membership_type, adult, child, img_png_bytes, pdf_bytes, filename}
+    # For <=10: list of {caption, img_png_bytes, pdf_bytes, filename}
     st.session_state.generated_items = []
 if "generated_zip" not in st.session_state:
-    # For >10: {"zip_bytes": bytes, "zip_name": str, "count": int}
+    # For >10: {"zip_file": SpooledTemporaryFile, "zip_name": str, "count": int}
     st.session_state.generated_zip = None
 if "_member_table_key" not in st.session_state:
     # Bump when Select All / Deselect All is used so data_editor re-inits with new selection
     st.session_state._member_table_key = 0
-if "_tmp_data_path" not in st.session_state:
-    st.session_state._tmp_data_path = None
 if "_tmp_banner_path" not in st.session_state:
     st.session_state._tmp_banner_path = None
 if "_last_appsheet_error" not in st.session_state:
     st.session_state._last_appsheet_error = None
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_members_from_bytes(data: bytes, suffix: str) -> "pd.DataFrame":
+    """Parse an uploaded members file; memoized on its content, so re-loading the same file skips parsing."""
+    # Write to a secure temp file (ignore user-provided filename); removed once parsed
+    with tempfile.NamedTemporaryFile(prefix="members_", suffix=suffix, delete=False) as tmp:
+        tmp.write(data)
+    try:
+        return load_members_dataframe(tmp.name)
+    finally:
+        try:
+            os.remove(tmp.name)
+        except OSError:
+            pass
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_members_from_path(path: str, mtime: float, size: int) -> "pd.DataFrame":
+    """Parse a members file on disk; keyed on (path, mtime, size) so an edited file is re-read."""
+    return load_members_dataframe(path)
+
+
+@st.cache_data(ttl=600, show_spinner=False, max_entries=4)
+def _fetch_members_appsheet(
+    app_id: str, table_name: str, region: str, key_sha256: str, _access_key: str
+) -> "pd.DataFrame":
+    """
+    AppSheet fetch memoized for 10 minutes per (app, table, region, key hash).
+    The key itself is underscore-prefixed so Streamlit never hashes or stores it as a cache key.
+    """
+    return load_members_dataframe_appsheet(
+        app_id=app_id,
+        table_name=table_name,
+        application_access_key=_access_key,
+        region=region,
+        timeout_s=30,
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _card_generator(banner_path: str, banner_mtime: float):
+    """One generator per banner file, shared across reruns so its banner/template caches stay warm."""
+    # Import heavy rendering code only when needed (improves Streamlit Cloud startup)
+    from app import MembershipCardGenerator
+
+    return MembershipCardGenerator(csv_path="", banner_path=banner_path, output_dir="output")
+
+
+def _compact_members(df: "pd.DataFrame") -> "pd.DataFrame":
+    """
+    Store Membership_Type as a categorical before the frame goes into session state:
+    it has a handful of distinct values, so every rerun's masks and copies work on int codes.
+    (Done here rather than in the loaders so chunked CSV loads still concatenate cleanly.)
+    """
+    if "Membership_Type" in df.columns:
+        df["Membership_Type"] = df["Membership_Type"].astype("category")
+    # The loaders already return a string dtype; this only guards frames built elsewhere,
+    # so the selection code can compare Member_ID to str without an astype(str) copy per use.
+    if df["Member_ID"].dtype == object:
+        df["Member_ID"] = df["Member_ID"].astype("string")
+    return df
+
+
+def _member_index(df: "pd.DataFrame") -> tuple:
+    """
+    Member IDs (as a list), an ID -> name map, and a lowercased "name\0id" search column,
+    built once per loaded frame and reused across reruns.
+    """
+    cached = st.session_state.get("_member_index")
+    if cached is None or cached[0] is not df:
+        ids = df["Member_ID"].tolist()
+        names = df["Name"].astype(str)
+        # NUL separator so a search term can never match across the name/ID boundary
+        search_blob = (names + "\0" + df["Member_ID"].astype(str)).str.lower()
+        cached = (df, ids, dict(zip(ids, names.tolist())), search_blob)
+        st.session_state._member_index = cached
+    return cached[1:]
+
+
+def _update_selection(ids: list, *, add: bool) -> None:
+    """Add ids to (or remove them from) the selection; IDs are stored as str, so plain set ops suffice."""
+    sel = set(st.session_state.selected_member_ids)
+    if add:
+        sel.update(ids)
+    else:
+        sel.difference_update(ids)
+    st.session_state.selected_member_ids = sorted(sel)
+
+
 def _reset_loaded_data():
+    _fetch_members_appsheet.clear()
     st.session_state.members_df = None
+    st.session_state._member_index = None
     st.session_state.selected_member_ids = []
     st.session_state.search_term = ""
     st.session_state.generated_items = []
     st.session_state.generated_zip = None
     # Clean up temp files created from uploads
-    for k in ("_tmp_data_path", "_tmp_banner_path"):
+    for k in ("_tmp_banner_path",):
         p = st.session_state.get(k)
         if p and isinstance(p, str) and os.path.exists(p):
             try:
@@ -198,16 +290,16 @@ if source == "AppSheet API":
             _t_fetch0 = time.perf_counter()
             _ui_log("appsheet fetch start")
             with st.spinner("Fetching members from AppSheet (can take ~10–30s)…"):
-                df = load_members_dataframe_appsheet(
-                    app_id=appsheet_app_id,
-                    table_name=appsheet_table,
-                    application_access_key=appsheet_key,
-                    region=appsheet_region,
-                    timeout_s=30,
-                    max_attempts=2,
+                key_sha256 = hashlib.sha256((appsheet_key or "").strip().encode("utf-8")).hexdigest()
+                df = _fetch_members_appsheet(
+                    (appsheet_app_id or "").strip(),
+                    (appsheet_table or "").strip(),
+                    (appsheet_region or "").strip(),
+                    key_sha256,
+                    appsheet_key,
                 )
             _ui_log(f"appsheet fetch done in {time.perf_counter() - _t_fetch0:.2f}s (rows={len(df)})")
-            st.session_state.members_df = df
+            st.session_state.members_df = _compact_members(df)
             stats = getattr(df, "attrs", {}).get("load_stats")
             if stats:
                 st.success(
@@ -234,7 +326,7 @@ else:
 
     required_columns_order = ["Member ID", "Full Name", "Membership Type", "Adult", "Child"]
     st.markdown("**Required columns (in order):**")
-    st.table(pd.DataFrame({"Column (in order)": required_columns_order}))
+    st.table({"Column (in order)": required_columns_order})
 
     def _uploaded_file_matches_required_format(uploaded) -> bool:
         """
@@ -246,26 +338,32 @@ else:
         if uploaded is None:
             return False
         name = (uploaded.name or "").lower()
+
+        # Only the header row is read here; the full file is parsed once, on load.
         try:
             if name.endswith((".xlsx", ".xls")):
-                raw = pd.read_excel(uploaded, sheet_name="Sheet1")
-                cols = [str(c).strip() for c in raw.columns]
-                if len(cols) < len(required_columns_order):
-                    return False
-                first = [c.lower() for c in cols[: len(required_columns_order)]]
-                required = [c.lower() for c in required_columns_order]
-                return first == required
-            if name.endswith(".csv"):
-                raw = pd.read_csv(uploaded)
-                cols = [str(c).strip() for c in raw.columns]
-                if len(cols) < len(required_columns_order):
-                    return False
-                first = [c.lower() for c in cols[: len(required_columns_order)]]
-                required = [c.lower() for c in required_columns_order]
-                return first == required
+                from openpyxl import load_workbook
+
+                wb = load_workbook(uploaded, read_only=True, data_only=True)
+                try:
+                    header = next(wb["Sheet1"].iter_rows(max_row=1, values_only=True), ())
+                finally:
+                    wb.close()
+                cols = ["" if c is None else str(c).strip() for c in header]
+            elif name.endswith(".csv"):
+                import pandas as pd
+
+                cols = [str(c).strip() for c in pd.read_csv(uploaded, nrows=0).columns]
+            else:
+                return False
         except Exception:
             return False
-        return False
+        finally:
+            uploaded.seek(0)
+        if len(cols) < len(required_columns_order):
+            return False
+        first = [c.lower() for c in cols[: len(required_columns_order)]]
+        return first == [c.lower() for c in required_columns_order]
 
     with st.form("local_load_form", clear_on_submit=False):
         data_file = st.file_uploader(
@@ -281,20 +379,9 @@ else:
             st.error("The uploaded file doesn't meet the required format.")
         else:
             try:
-                # Write to a secure temp file (ignore user-provided filename)
-                prev = st.session_state.get("_tmp_data_path")
-                if prev and os.path.exists(prev):
-                    try:
-                        os.remove(prev)
-                    except OSError:
-                        pass
                 suffix = ".xlsx" if str(data_file.name).lower().endswith(".xlsx") else ".csv"
-                with tempfile.NamedTemporaryFile(prefix="members_", suffix=suffix, delete=False) as tmp:
-                    tmp.write(data_file.getbuffer())
-                    st.session_state._tmp_data_path = tmp.name
-
-                df = load_members_dataframe(st.session_state._tmp_data_path)
-                st.session_state.members_df = df
+                df = _load_members_from_bytes(data_file.getvalue(), suffix)
+                st.session_state.members_df = _compact_members(df)
                 stats = getattr(df, "attrs", {}).get("load_stats")
                 if stats:
                     st.success(
@@ -319,8 +406,9 @@ else:
             st.caption(f"Default template: `{Path(default_path).name}`")
             if st.button(f"📥 Load default ({Path(default_path).name})"):
                 try:
-                    df = load_members_dataframe(default_path)
-                    st.session_state.members_df = df
+                    st_default = os.stat(default_path)
+                    df = _load_members_from_path(default_path, st_default.st_mtime, st_default.st_size)
+                    st.session_state.members_df = _compact_members(df)
                     stats = getattr(df, "attrs", {}).get("load_stats")
                     if stats:
                         st.success(
@@ -369,9 +457,19 @@ with st.expander("Banner (optional)", expanded=False):
 if st.button("🧼 Clear loaded data"):
     _reset_loaded_data()
 
-# Display member selection interface
-if st.session_state.members_df is not None and st.session_state.banner_path is not None:
+# st.fragment (Streamlit >= 1.37; experimental_fragment since 1.33) reruns only the decorated
+# function on widget interactions inside it; older Streamlit falls back to full-script reruns.
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None) or (lambda f: f)
+
+
+@_fragment
+def _member_selection(mobile_mode: bool) -> None:
+    """
+    Member search/selection and card generation. Run as a fragment, so checkbox toggles, search
+    and Generate clicks rerun only this section, not the data-source forms above it.
+    """
     df = st.session_state.members_df
+    member_ids, id_to_name, search_blob = _member_index(df)
     
     st.header("👥 Select Members")
     
@@ -382,7 +480,7 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
     
     with col2:
         if st.button("✅ Select All", use_container_width=True):
-            st.session_state.selected_member_ids = list(df["Member_ID"].astype(str))
+            st.session_state.selected_member_ids = list(member_ids)
             st.session_state._member_table_key = st.session_state.get("_member_table_key", 0) + 1
         if st.button("❌ Deselect All", use_container_width=True):
             st.session_state.selected_member_ids = []
@@ -416,21 +514,21 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
         if search_term:
             st.caption(f"Search applied: `{search_term}`")
     if search_term:
-        name_mask = df["Name"].astype(str).str.contains(search_term, case=False, na=False)
-        id_mask = df["Member_ID"].astype(str).str.contains(search_term, case=False, na=False)
-        filtered_df = df[name_mask | id_mask].copy()
+        # One literal scan over the prebuilt lowercased name/ID column (no regex, no re-lowercasing)
+        filtered_df = df[search_blob.str.contains(search_term.lower(), regex=False, na=False)]
     else:
-        filtered_df = df.copy()
+        filtered_df = df  # read-only below: the display frame is built by reindex, never in place
     
     # Create a scrollable table with checkboxes
     # Build display dataframe with Select column initialized from session state
-    for col in ("Membership_Type", "Adult", "Child"):
-        if col not in filtered_df.columns:
-            filtered_df[col] = ""
-    display_df = filtered_df[["Name", "Membership_Type", "Adult", "Child", "Member_ID"]].copy().reset_index(drop=True)
-    selected_set = set(map(str, st.session_state.selected_member_ids))
-    display_df["Member_ID"] = display_df["Member_ID"].astype(str)
-    display_df["Select"] = display_df["Member_ID"].apply(lambda mid: mid in selected_set)
+    # (reindex copies only the five shown columns and fills any missing optional one with "")
+    display_df = filtered_df.reindex(
+        columns=["Name", "Membership_Type", "Adult", "Child", "Member_ID"], fill_value=""
+    ).reset_index(drop=True)
+    # data_editor renders categoricals as selectboxes; keep the column plain text there
+    display_df["Membership_Type"] = display_df["Membership_Type"].astype(str)
+    selected_set = set(st.session_state.selected_member_ids)
+    display_df["Select"] = display_df["Member_ID"].isin(selected_set)
     display_df_for_editor = display_df[["Select", "Name", "Membership_Type", "Adult", "Child", "Member_ID"]].copy()
     baseline_state = dict(zip(display_df["Member_ID"].tolist(), display_df["Select"].tolist()))
     
@@ -438,18 +536,12 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
     b1, b2 = st.columns([1, 1])
     with b1:
         if st.button("Select filtered", use_container_width=True):
-            sel = set(map(str, st.session_state.selected_member_ids))
-            sel.update(display_df["Member_ID"].astype(str).tolist())
-            st.session_state.selected_member_ids = sorted(sel)
+            _update_selection(display_df["Member_ID"].tolist(), add=True)
     with b2:
         if st.button("Clear filtered", use_container_width=True):
-            sel = set(map(str, st.session_state.selected_member_ids))
-            for mid in display_df["Member_ID"].astype(str).tolist():
-                sel.discard(mid)
-            st.session_state.selected_member_ids = sorted(sel)
+            _update_selection(display_df["Member_ID"].tolist(), add=False)
 
     # Selected members (full-width, so more names are visible)
-    id_to_name = dict(zip(df["Member_ID"].astype(str), df["Name"].astype(str)))
 
     def _sync_multiselect_to_selection():
         new_val = sorted(set(map(str, st.session_state.selected_member_ids_widget)))
@@ -463,9 +555,16 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
     ):
         del st.session_state["selected_member_ids_widget"]
 
+    # Offer the current selection plus the first visible (searched) rows, not every member:
+    # the options list is sent to the browser on each rerun. Search to surface other IDs.
+    picker_options = list(
+        dict.fromkeys(
+            [*st.session_state.selected_member_ids, *display_df["Member_ID"].head(MULTISELECT_MAX_OPTIONS).tolist()]
+        )
+    )
     st.multiselect(
         "Selected members",
-        options=df["Member_ID"].astype(str).tolist(),
+        options=picker_options,
         default=st.session_state.selected_member_ids,
         format_func=lambda mid: f"{id_to_name.get(mid, '')} ({mid})" if id_to_name.get(mid) else mid,
         key="selected_member_ids_widget",
@@ -482,6 +581,12 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
         "Member_ID": st.column_config.TextColumn("Member ID", width="large"),
     }
     
+    # Stable signature of the visible rows: the editor keeps its state while they are unchanged
+    # (unlike hash(), blake2b does not vary per process).
+    table_sig = hashlib.blake2b(
+        "\0".join([search_term, *display_df["Member_ID"].tolist()]).encode("utf-8"), digest_size=8
+    ).hexdigest()
+
     # Display as scrollable table with fixed height (creates internal scrollbar).
     # Key includes _member_table_key so Select All / Deselect All force re-init (avoids stale checkbox state).
     edited_df = st.data_editor(
@@ -490,21 +595,21 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
         hide_index=True,
         use_container_width=True,
         height=500,  # Fixed height - creates internal scrollbar
-        key=f"member_table_{hash(search_term)}_{st.session_state._member_table_key}",
+        key=f"member_table_{table_sig}_{st.session_state._member_table_key}",
     )
     
     # Sync selection state from the edited dataframe only when selection is small.
     # With 50+ rows, the data_editor often returns stale/partial checkbox state, which would
     # clear "Select All". So when many are selected, never let the table overwrite selection.
-    sel = set(map(str, st.session_state.selected_member_ids))
-    visible_ids = display_df["Member_ID"].astype(str).tolist()
+    sel = set(st.session_state.selected_member_ids)
+    visible_ids = display_df["Member_ID"].tolist()
     sync_from_editor = len(sel) <= 20
     if sync_from_editor:
-        for idx, row in edited_df.iterrows():
+        for idx, checked in edited_df[["Select"]].itertuples(index=True, name=None):
             if idx >= len(visible_ids):
                 continue
             mid = visible_ids[idx]
-            checked = bool(row.get("Select"))
+            checked = bool(checked)
             was_checked = bool(baseline_state.get(mid, False))
             if checked and not was_checked:
                 sel.add(mid)
@@ -533,27 +638,26 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
         if selected_count == 0:
             st.caption("No members selected yet. Search → check a row → keep searching and adding more.")
         else:
-            selected_ids = set(map(str, st.session_state.selected_member_ids))
-            selected_view = df[df["Member_ID"].astype(str).isin(selected_ids)].copy()
-            # Preserve the selection ordering
+            selected_ids = set(st.session_state.selected_member_ids)
+            import pandas as pd
+
+            # Filtered read only: no defensive copy, the view is never modified in place
+            selected_view = df[df["Member_ID"].isin(selected_ids)]
+            # Preserve the selection ordering: sort on categorical codes (ints) instead of a dict map
             order = {mid: i for i, mid in enumerate(st.session_state.selected_member_ids)}
-            selected_view["_ord"] = selected_view["Member_ID"].astype(str).map(order).fillna(10**9)
-            selected_view = selected_view.sort_values("_ord").drop(columns=["_ord"])
-            for col in ("Membership_Type", "Adult", "Child"):
-                if col not in selected_view.columns:
-                    selected_view[col] = ""
+            codes = pd.Categorical(selected_view["Member_ID"], categories=list(order), ordered=True).codes
+            selected_view = selected_view.iloc[codes.argsort(kind="stable")]
             st.dataframe(
-                selected_view[["Name", "Membership_Type", "Adult", "Child", "Member_ID"]],
+                selected_view.reindex(columns=["Name", "Membership_Type", "Adult", "Child", "Member_ID"], fill_value=""),
                 use_container_width=True,
                 height=220,
             )
             # Quick remove via multiselect (explicit deselect)
-            id_to_name_all = dict(zip(df["Member_ID"].astype(str), df["Name"].astype(str)))
             to_remove = st.multiselect(
                 "Remove selected (explicit deselect)",
                 options=st.session_state.selected_member_ids,
                 default=[],
-                format_func=lambda mid: f"{id_to_name_all.get(mid, '')} ({mid})" if id_to_name_all.get(mid) else mid,
+                format_func=lambda mid: f"{id_to_name.get(mid, '')} ({mid})" if id_to_name.get(mid) else mid,
                 key="remove_selected_ids_widget",
             )
             if to_remove:
@@ -580,108 +684,148 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
         else:
             with st.spinner(f"Generating {selected_count} card(s)..."):
                 try:
+                    # Previews from the last run, by render key: regenerating an unchanged card reuses them
+                    previous_items = {
+                        it["render_key"]: it for it in st.session_state.generated_items if "render_key" in it
+                    }
                     # Reset previous outputs
                     st.session_state.generated_items = []
                     st.session_state.generated_zip = None
 
-                    # Import heavy rendering code only when needed (improves Streamlit Cloud startup)
-                    from app import MembershipCardGenerator
-
-                    selected_ids = set(map(str, st.session_state.selected_member_ids))
-                    selected_df = df[df["Member_ID"].astype(str).isin(selected_ids)].copy()
-                    for col in ("Membership_Type", "Adult", "Child"):
-                        if col not in selected_df.columns:
-                            selected_df[col] = ""
-
-                    # Initialize generator (no output dir usage in UI)
-                    generator = MembershipCardGenerator(
-                        csv_path="",
-                        banner_path=st.session_state.banner_path,
-                        output_dir="output",
+                    selected_ids = set(st.session_state.selected_member_ids)
+                    selected_df = df[df["Member_ID"].isin(selected_ids)].reindex(
+                        columns=["Name", "Member_ID", "Membership_Type", "Adult", "Child"], fill_value=""
                     )
+                    total = len(selected_df)
+                    # Drop rows without a name or ID in one vectorized pass, before the render loop
+                    name_ok = selected_df["Name"].astype(str).str.strip().ne("")
+                    valid = name_ok & selected_df["Member_ID"].astype(str).str.strip().ne("")
+                    skipped = int((~valid).sum())
+                    selected_df = selected_df[valid]
+
+                    # Reuse the cached generator for this banner (no output dir usage in UI)
+                    banner_path = st.session_state.banner_path
+                    banner_mtime = os.path.getmtime(banner_path)
+                    generator = _card_generator(banner_path, banner_mtime)
                     # Load banner once for this run
                     banner_base = generator.load_banner_image()
                     
                     # Generate cards
                     progress_bar = st.progress(0)
                     status_text = st.empty()
+                    # Each progress update is a websocket message: send at most ~20/s (plus the last one)
+                    last_progress_t = 0.0
                     
-                    members_list = list(selected_df[["Name", "Member_ID", "Membership_Type", "Adult", "Child"]].itertuples(index=False, name=None))
-                    total = len(members_list)
+                    # Sanitize every filename in one vectorized pass rather than per card
+                    selected_df = selected_df.assign(_filename=safe_pdf_filenames(selected_df["Name"].astype(str)))
+                    # Row tuples straight from per-column lists (Name, Member_ID, Membership_Type, Adult, Child, _filename)
+                    members_list = list(zip(*(selected_df[c].tolist() for c in selected_df.columns)))
+                    n_render = len(members_list)
 
                     if total > MAX_INDIVIDUAL_DOWNLOADS:
+                        import zipfile
+
                         # Use a spooled temp file so large ZIPs spill to disk instead of RAM.
                         zip_buf = tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_BYTES)
-                        skipped = 0
-                        with zipfile.ZipFile(zip_buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-                            for i, (name, member_id, membership_type, adult, child) in enumerate(members_list):
-                                if not str(name).strip() or not str(member_id).strip():
-                                    skipped += 1
+                        failed = []
+                        # ZIP_STORED: the PDFs' pixels are already Flate-compressed, deflating again buys nothing
+                        with zipfile.ZipFile(zip_buf, "w", compression=zipfile.ZIP_STORED) as zf:
+                            # Results arrive in order; RENDER_WORKERS > 1 fans out over a process pool
+                            renders = generator.render_pdfs(members_list, max_workers=RENDER_WORKERS)
+                            for i, (m, pdf_bytes, error) in enumerate(renders, 1):
+                                name, filename = m[0], m[5]
+                                if error is not None:
+                                    failed.append(f"{name}: {error}")
                                     continue
-                                qr_img = generator.generate_qr_code(member_id, name)
-                                banner_img = banner_base.copy()
-                                card_img = generator.create_card_image(
-                                    name,
-                                    member_id,
-                                    qr_img,
-                                    banner_img,
-                                    membership_type=membership_type,
-                                    adult=str(adult),
-                                    child=str(child),
-                                )
-                                pdf_bytes = generator.create_pdf_bytes(card_img)
-                                zf.writestr(safe_pdf_filename(str(name)), pdf_bytes)
+                                zf.writestr(filename, pdf_bytes)
 
-                                progress_bar.progress((i + 1) / total)
-                                status_text.text(f"Prepared {i + 1}/{total}: {name}")
+                                now = time.perf_counter()
+                                if i == n_render or now - last_progress_t >= 0.05:
+                                    last_progress_t = now
+                                    progress_bar.progress(i / n_render)
+                                    status_text.text(f"Prepared {i}/{n_render}: {name}")
 
                         progress_bar.empty()
                         status_text.empty()
                         zip_name = "CTBA_2026_membership_cards.zip"
-                        zip_buf.seek(0)
+                        # Keep the spooled file (on disk once large) rather than a second in-memory copy
                         st.session_state.generated_zip = {
-                            "zip_bytes": zip_buf.read(),
+                            "zip_file": zip_buf,
                             "zip_name": zip_name,
                             "count": total,
                         }
                         if skipped:
                             st.warning(f"Skipped {skipped} row(s) due to missing Name/Member ID.")
+                        if failed:
+                            st.warning(f"Could not render {len(failed)} card(s): " + "; ".join(failed[:5]))
                     else:
-                        skipped = 0
-                        for i, (name, member_id, membership_type, adult, child) in enumerate(members_list):
-                            if not str(name).strip() or not str(member_id).strip():
-                                skipped += 1
-                                continue
-                            qr_img = generator.generate_qr_code(member_id, name)
-                            banner_img = banner_base.copy()
-                            card_img = generator.create_card_image(
-                                name,
-                                member_id,
-                                qr_img,
-                                banner_img,
-                                membership_type=membership_type,
-                                adult=str(adult),
-                                child=str(child),
-                            )
-                            pdf_bytes = generator.create_pdf_bytes(card_img)
-
-                            img_buf = io.BytesIO()
-                            card_img.save(img_buf, format="PNG")
-
-                            st.session_state.generated_items.append(
-                                {
-                                    "name": str(name),
-                                    "membership_type": str(membership_type or ""),
-                                    "adult": str(adult or ""),
-                                    "child": str(child or ""),
-                                    "img_png_bytes": img_buf.getvalue(),
-                                    "pdf_bytes": pdf_bytes,
-                                    "filename": safe_pdf_filename(str(name)),
-                                }
+                        # Prefetch QR codes on a helper thread while the previous card is composited and
+                        # encoded (numpy/PIL release the GIL for the heavy parts of both steps).
+                        from concurrent.futures import ThreadPoolExecutor
+
+                        from PIL import Image
+
+                        preview_px = 2 * max(PREVIEW_WIDTH_DESKTOP, PREVIEW_WIDTH_MOBILE)
+                        render_keys = [
+                            hashlib.blake2b(repr((banner_path, banner_mtime) + m).encode("utf-8"), digest_size=16).digest()
+                            for m in members_list
+                        ]
+                        with ThreadPoolExecutor(max_workers=1) as qr_pool:
+                            qr_imgs = qr_pool.map(
+                                lambda m: generator.generate_qr_code(m[1], m[0], size_px=generator.qr_size_px),
+                                [m for m, key in zip(members_list, render_keys) if key not in previous_items],
                             )
+                            for i, (name, member_id, membership_type, adult, child, filename) in enumerate(members_list):
+                                render_key = render_keys[i]
+                                if render_key in previous_items:
+                                    # Same banner and same row as last time: the card would be byte-identical
+                                    st.session_state.generated_items.append(previous_items[render_key])
+                                    continue
+                                qr_img = next(qr_imgs)
+                                card_img = generator.create_card_image(
+                                    name,
+                                    member_id,
+                                    qr_img,
+                                    banner_base,
+                                    membership_type=membership_type,
+                                    adult=str(adult),
+                                    child=str(child),
+                                )
+                                pdf_bytes = generator.create_pdf_bytes(card_img)
+
+                                # Previews are shown at most PREVIEW_WIDTH_* wide: store them at 2x that
+                                # (sharp on high-DPI screens) instead of the full 300 DPI render.
+                                preview_img = card_img
+                                if card_img.width > preview_px:
+                                    preview_h = round(card_img.height * preview_px / card_img.width)
+                                    preview_img = card_img.resize((preview_px, preview_h), Image.Resampling.LANCZOS)
+                                img_buf = io.BytesIO()
+                                # Transient preview: fastest deflate level (bigger bytes, ~3-6x quicker encode)
+                                preview_img.save(img_buf, format="PNG", compress_level=1, optimize=False)
+
+                                # Caption is built once here, not on every rerun that shows the preview
+                                parts = []
+                                if membership_type:
+                                    parts.append(str(membership_type))
+                                if adult:
+                                    parts.append(f"Adults {adult}")
+                                if child:
+                                    parts.append(f"Kids {child}")
+                                st.session_state.generated_items.append(
+                                    {
+                                        "caption": str(name) + ((" — " + ", ".join(parts)) if parts else ""),
+                                        "img_png_bytes": img_buf.getvalue(),
+                                        "pdf_bytes": pdf_bytes,
+                                        "filename": filename,
+                                        "render_key": render_key,
+                                    }
+                                )
 
-                            progress_bar.progress((i + 1) / total)
-                            status_text.text(f"Prepared {i + 1}/{total}: {name}")
+                                now = time.perf_counter()
+                                if i + 1 == n_render or now - last_progress_t >= 0.05:
+                                    last_progress_t = now
+                                    progress_bar.progress((i + 1) / n_render)
+                                    status_text.text(f"Prepared {i + 1}/{n_render}: {name}")
 
                         progress_bar.empty()
                         status_text.empty()
@@ -692,16 +836,17 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
                     st.error(f"Error during generation: {e}")
                 except Exception as e:
                     st.error(f"Unexpected error during generation: {e}")
-                    import traceback
-                    st.code(traceback.format_exc())
+                    st.exception(e)
 
     # Render generated outputs (persisted in session)
     if st.session_state.generated_zip is not None:
         z = st.session_state.generated_zip
         st.warning(f"More than 10 selected (**{z['count']}**). Download as a single ZIP.")
+        # The ZIP's bytes exist only while the button is marshalled, not for the whole session
+        z["zip_file"].seek(0)
         st.download_button(
             "⬇️ Download ZIP",
-            data=z["zip_bytes"],
+            data=z["zip_file"].read(),
             file_name=z["zip_name"],
             mime="application/zip",
             key="dl_zip",
@@ -720,15 +865,7 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
                     idx = start + c
                     with cols[c]:
                         st.image(it["img_png_bytes"], width=PREVIEW_WIDTH)
-                        parts = []
-                        if it["membership_type"]:
-                            parts.append(it["membership_type"])
-                        if it["adult"] and str(it["adult"]).lower() != "nan":
-                            parts.append(f"Adults {it['adult']}")
-                        if it["child"] and str(it["child"]).lower() != "nan":
-                            parts.append(f"Kids {it['child']}")
-                        cap = it["name"] + ((" — " + ", ".join(parts)) if parts else "")
-                        st.caption(cap)
+                        st.caption(it["caption"])
                         st.download_button(
                             "Download",
                             data=it["pdf_bytes"],
@@ -747,6 +884,10 @@ if st.session_state.members_df is not None and st.session_state.banner_path is n
                     key=f"dl_list_{idx}_{it['filename']}",
                 )
 
+
+# Display member selection interface
+if st.session_state.members_df is not None and st.session_state.banner_path is not None:
+    _member_selection(mobile_mode)
 elif st.session_state.members_df is None:
     st.info("👈 Choose a data source above (AppSheet API or Upload file), then click **Load** / **Fetch** to load members.")
 elif st.session_state.banner_path is None:
@@ -1,17 +1,58 @@
+import functools
 import re
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import pandas as pd
 
+_UNSAFE_RE = re.compile(r"[^A-Za-z0-9 _-]+")
+_WS_RE = re.compile(r"\s+")
+# Deletes every ASCII code point _UNSAFE_RE would remove (ASCII fast path for safe_pdf_filename).
+_UNSAFE_ASCII_TBL = str.maketrans(
+    "", "", "".join(chr(b) for b in range(128) if not (chr(b).isalnum() or chr(b) in " _-"))
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def safe_pdf_filename(name: str) -> str:
     """
     Convert a display name into a safe PDF filename.
     - Uses only letters/numbers/spaces/_/-
     - Collapses whitespace to underscores
-    - Falls back to 'member.pdf'
+    - Falls back to 'member.pdf' (also for missing values: None, NaN, pd.NA)
+
+    Memoized: batches and re-renders sanitize the same names repeatedly.
+    Long-running processes can call safe_pdf_filename.cache_clear().
     """
-    raw = "" if name is None else str(name)
-    safe = re.sub(r"[^A-Za-z0-9 _-]+", "", raw).strip()
-    safe = re.sub(r"\s+", "_", safe)
+    try:
+        missing = name is None or bool(name != name)  # NaN is the only value unequal to itself
+    except TypeError:  # pd.NA: its comparisons are NA as well
+        missing = True
+    raw = "" if missing else str(name)
+    if raw.isascii():
+        # Common case: plain letters/digits/spaces need no filtering at all.
+        if not raw.replace(" ", "").isalnum():
+            raw = raw.translate(_UNSAFE_ASCII_TBL)
+        # Only spaces survive the table, so split/join == strip + collapse runs to "_".
+        safe = "_".join(raw.split())
+    else:
+        safe = _WS_RE.sub("_", _UNSAFE_RE.sub("", raw).strip())
     if not safe:
         safe = "member"
     return f"{safe}.pdf"
 
+
+def safe_pdf_filenames(names: "pd.Series") -> "pd.Series":
+    """
+    Vectorized safe_pdf_filename over a Series of names (same rules, same output per element;
+    missing values give member.pdf in both).
+    Runs as one pandas .str pipeline instead of a Python call per row.
+    """
+    safe = (
+        names.fillna("")
+        .astype(str)
+        .str.replace(_UNSAFE_RE, "", regex=True)
+        .str.strip()
+        .str.replace(_WS_RE, "_", regex=True)
+    )
+    return safe.mask(safe == "", "member") + ".pdf"